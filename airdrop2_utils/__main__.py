@@ -0,0 +1,5 @@
+from airdrop2_utils.cli import main
+
+
+if __name__ == '__main__':
+    main()
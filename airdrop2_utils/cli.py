@@ -0,0 +1,231 @@
+import argparse
+import csv
+import logging
+import os
+import sys
+import time
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+
+logger = logging.getLogger(__name__)
+
+
+STARTED_AT = time.perf_counter()
+
+SNAPSHOT_TIME = datetime(2022, 1, 15, tzinfo=timezone.utc)
+
+
+@contextmanager
+def log_duration(message):
+    started_at = time.perf_counter()
+    try:
+        yield
+    finally:
+        logger.info(f'{message} took {time.perf_counter() - started_at:.3f}s.')
+
+
+def get_process_uptime():
+    try:
+        with open('/proc/self/stat') as f:
+            stat = f.read()
+        with open('/proc/uptime') as f:
+            system_uptime = float(f.read().split()[0])
+    except OSError:
+        return None
+
+    # Process name may contain spaces, so count fields after its closing paren. Start time is field 22.
+    start_ticks = int(stat.rsplit(')', 1)[1].split()[19])
+    return system_uptime - start_ticks / os.sysconf('SC_CLK_TCK')
+
+
+@contextmanager
+def open_output(output_file):
+    if output_file == '-':
+        yield sys.stdout
+        return
+
+    logger.info(f'Save {output_file}.')
+
+    with open(output_file, 'w') as f:
+        yield f
+
+
+def write_csv(output_file, header, rows, *, tuples_only):
+    with open_output(output_file) as f:
+        csv_writer = csv.writer(f)
+
+        if not tuples_only:
+            csv_writer.writerow(header)
+
+        csv_writer.writerows(rows)
+
+
+def price_command(args):
+    with log_duration('Imports'):
+        from airdrop2_utils.horizon import get_aqua_price
+
+    aqua_price = get_aqua_price(SNAPSHOT_TIME)
+
+    print(aqua_price)
+
+
+def pools_command(args):
+    with log_duration('Imports'):
+        from airdrop2_utils.constants.assets import AQUA, XLM, YXLM
+        from airdrop2_utils.snapshot import load_liquidity_pool_participants, reduce_liquidity_pool_participants
+        from airdrop2_utils.stellar_core_db.session import make_session
+
+    with make_session(args.db) as session:
+        participants = [
+            participant
+            for asset in (XLM, YXLM, AQUA)
+            for participant in reduce_liquidity_pool_participants(
+                load_liquidity_pool_participants(asset, session=session),
+            )
+        ]
+
+    write_csv(
+        args.output,
+        ['Account id', 'Reserved asset', 'Reserved balance'],
+        (
+            [participant['account_id'], participant['reserved_asset'].code, participant['reserved_balance']]
+            for participant in participants
+        ),
+        tuples_only=args.tuples_only,
+    )
+
+
+def locks_command(args):
+    with log_duration('Imports'):
+        from airdrop2_utils.snapshot import load_locks, reduce_locks
+        from airdrop2_utils.stellar_core_db.session import make_session
+
+    with make_session(args.db) as session:
+        locks = list(reduce_locks(load_locks(session=session)))
+
+    write_csv(
+        args.output,
+        ['Account id', 'Locked AQUA balance', 'Lock terms'],
+        ([lock['account_id'], lock['amount'], lock['term']] for lock in locks),
+        tuples_only=args.tuples_only,
+    )
+
+
+def candidates_command(args):
+    with log_duration('Imports'):
+        from airdrop2_utils.snapshot import load_airdrop_candidates
+        from airdrop2_utils.stellar_core_db.session import make_session
+
+    with make_session(args.db) as session:
+        candidates = list(load_airdrop_candidates(session=session))
+
+    write_csv(
+        args.output,
+        ['Account id', 'Native balance', 'yXLM balance', 'AQUA balance'],
+        (
+            [candidate['account_id'], candidate['native_balance'], candidate['yxlm_balance'], candidate['aqua_balance']]
+            for candidate in candidates
+        ),
+        tuples_only=args.tuples_only,
+    )
+
+
+def snapshot_command(args):
+    with log_duration('Imports'):
+        from airdrop2_utils.horizon import get_aqua_price
+        from airdrop2_utils.snapshot import load_airdrop_accounts, set_airdrop_rewards
+        from airdrop2_utils.stellar_core_db.session import make_session
+
+    aqua_price = get_aqua_price(SNAPSHOT_TIME)
+
+    logger.info('AQUA price loaded.')
+
+    with make_session(args.db) as session:
+        snapshot = list(set_airdrop_rewards(load_airdrop_accounts(session=session, aqua_price=aqua_price)))
+
+    write_csv(
+        args.output,
+        [
+            'Account id',
+            'Native balance',
+            'yXLM balance',
+            'AQUA balance',
+            'Native AMM balance',
+            'yXLM AMM balance',
+            'AQUA AMM balance',
+            'Locked AQUA balance',
+            'Lock terms',
+            'Airdrop shares',
+            'Airdrop rewards',
+        ],
+        (
+            [
+                airdrop_account['account_id'],
+                airdrop_account['native_balance'],
+                airdrop_account['yxlm_balance'],
+                airdrop_account['aqua_balance'],
+                airdrop_account['native_pool_balance'],
+                airdrop_account['yxlm_pool_balance'],
+                airdrop_account['aqua_pool_balance'],
+                airdrop_account['aqua_lock_balance'],
+                airdrop_account['aqua_lock_term'],
+                airdrop_account['airdrop_shares'],
+                airdrop_account['airdrop_reward'],
+            ]
+            for airdrop_account in snapshot
+        ),
+        tuples_only=args.tuples_only,
+    )
+
+
+def make_parser():
+    parser = argparse.ArgumentParser(prog='airdrop2_utils', description='AQUA airdrop #2 snapshot utils.')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    price_parser = subparsers.add_parser('price', help='Print AQUA price in XLM at snapshot time.')
+    price_parser.set_defaults(command_func=price_command)
+
+    db_commands = [
+        ('pools', pools_command, 'Export AMM balances of XLM, yXLM and AQUA pools participants.'),
+        ('locks', locks_command, 'Export AQUA locks.'),
+        ('candidates', candidates_command, 'Export accounts matching airdrop balance requirements.'),
+        ('snapshot', snapshot_command, 'Export full airdrop snapshot with rewards.'),
+    ]
+    for name, command, help_text in db_commands:
+        subparser = subparsers.add_parser(name, help=help_text)
+        subparser.add_argument('--db', required=False, default='user=stellar dbname=stellar',
+                               help='Stellar core database url.')
+        subparser.add_argument('--output', required=False, default=f'{name}.csv',
+                               help='Output csv file, "-" for stdout.')
+        subparser.add_argument('--tuples-only', action=argparse.BooleanOptionalAction,
+                               help='Omit csv header.')
+        subparser.set_defaults(command_func=command)
+
+    return parser
+
+
+def setup_logging():
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.INFO)
+
+    # Keep stdout clean for "--output=-" and price command.
+    log_handler = logging.StreamHandler(sys.stderr)
+    formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
+    log_handler.setFormatter(formatter)
+    root_logger.addHandler(log_handler)
+
+
+def main(argv=None):
+    args = make_parser().parse_args(argv)
+
+    setup_logging()
+
+    process_uptime = get_process_uptime()
+    if process_uptime is not None:
+        logger.info(f'Startup took {process_uptime:.2f}s.')
+    else:
+        logger.info(f'CLI argument parsing took {time.perf_counter() - STARTED_AT:.3f}s.')
+
+    with log_duration(f'Command "{args.command}"'):
+        args.command_func(args)
@@ -0,0 +1,42 @@
+# Executed inside multiprocessing workers, so keep SQLAlchemy and orm models out of imports.
+from typing import Optional
+
+from stellar_sdk import Keypair
+
+from airdrop2_utils.constants.airdrop import LOCK_START_TIMESTAMP, MAX_LOCK_TERM
+from airdrop2_utils.constants.assets import AQUA
+from airdrop2_utils.constants.stellar import XLM_TO_STROOP
+from airdrop2_utils.data import Lock
+from airdrop2_utils.stellar_core_db.types_cast import unpack_claimable_balance
+
+
+AQUA_XDR = AQUA.to_xdr_object()
+
+
+def parse_lock(ledger_entry_xdr: str) -> Optional[Lock]:
+    claimable_balance_entry, sponsor = unpack_claimable_balance(ledger_entry_xdr)
+    if claimable_balance_entry.asset != AQUA_XDR:
+        return
+
+    if len(claimable_balance_entry.claimants) != 1:
+        return
+
+    claimant = claimable_balance_entry.claimants[0]
+    if sponsor != claimant.v0.destination.account_id:
+        return
+
+    predicate = claimant.v0.predicate
+    if not predicate.not_predicate or not predicate.not_predicate.abs_before:
+        return
+
+    unlock_at = predicate.not_predicate.abs_before.int64
+    if unlock_at < LOCK_START_TIMESTAMP:
+        return
+
+    account_keypair = Keypair.from_raw_ed25519_public_key(claimant.v0.destination.account_id.ed25519.uint256)
+
+    return Lock(
+        account_id=account_keypair.public_key,
+        amount=claimable_balance_entry.amount.int64 / XLM_TO_STROOP,
+        term=min(unlock_at - LOCK_START_TIMESTAMP, MAX_LOCK_TERM),
+    )
@@ -3,17 +3,16 @@ import operator
 from decimal import ROUND_DOWN, Decimal
 from functools import reduce
 from multiprocessing import Pool
-from typing import Iterable, Optional
+from typing import Iterable
 
 from sqlalchemy.orm import Session
-from stellar_sdk import Asset, Keypair
+from stellar_sdk import Asset
 
 from airdrop2_utils.constants.airdrop import (
     AIRDROP_CAP,
     AIRDROP_CAP_EXCEPTIONS,
     AIRDROP_VALUE,
     AQUA_REQUIREMENTS,
-    LOCK_START_TIMESTAMP,
     MAX_LOCK_BOOST,
     MAX_LOCK_TERM,
     XLM_REQUIREMENTS,
@@ -21,16 +20,15 @@ from airdrop2_utils.constants.airdrop import (
 from airdrop2_utils.constants.assets import AQUA, XLM, YXLM
 from airdrop2_utils.constants.stellar import XLM_TO_STROOP
 from airdrop2_utils.data import AirdropAccount, LiquidityPoolData, LiquidityPoolParticipant, Lock
-from airdrop2_utils.stellar_core_db.models import ClaimableBalance
+from airdrop2_utils.locks import parse_lock
 from airdrop2_utils.stellar_core_db.queries import (
     get_airdrop_candidates,
-    get_all_claimable_balances,
+    get_all_claimable_balance_entries,
     get_asset_liquidity_pool,
     get_trustline_for_liquidity_pools,
 )
 from airdrop2_utils.stellar_core_db.types_cast import (
     pack_trust_line_asset,
-    unpack_claimable_balance,
     unpack_liquidity_pool_data,
     unpack_trust_line_balance,
 )
@@ -125,41 +123,12 @@ def reduce_liquidity_pool_participants(
     yield from accumulator.values()
 
 
-def parse_lock(claimable_balance: ClaimableBalance) -> Optional[Lock]:
-    claimable_balance_entry, sponsor = unpack_claimable_balance(claimable_balance.ledgerentry)
-    if claimable_balance_entry.asset != AQUA.to_xdr_object():
-        return
-
-    if len(claimable_balance_entry.claimants) != 1:
-        return
-
-    claimant = claimable_balance_entry.claimants[0]
-    if sponsor != claimant.v0.destination.account_id:
-        return
-
-    predicate = claimant.v0.predicate
-    if not predicate.not_predicate or not predicate.not_predicate.abs_before:
-        return
-
-    unlock_at = predicate.not_predicate.abs_before.int64
-    if unlock_at < LOCK_START_TIMESTAMP:
-        return
-
-    account_keypair = Keypair.from_raw_ed25519_public_key(claimant.v0.destination.account_id.ed25519.uint256)
-
-    return Lock(
-        account_id=account_keypair.public_key,
-        amount=claimable_balance_entry.amount.int64 / XLM_TO_STROOP,
-        term=min(unlock_at - LOCK_START_TIMESTAMP, MAX_LOCK_TERM),
-    )
-
-
 def load_locks(*, session: Session) -> Iterable[Lock]:
-    query = get_all_claimable_balances()
-    claimable_balances = (balance for balance, in session.execute(query))
+    query = get_all_claimable_balance_entries()
+    ledger_entries = (ledger_entry for ledger_entry, in session.execute(query))
 
     with Pool() as pool:
-        for index, lock in enumerate(pool.imap_unordered(parse_lock, claimable_balances)):
+        for index, lock in enumerate(pool.imap_unordered(parse_lock, ledger_entries)):
             if index % 1000 == 0:
                 logger.info(f'Parsed claimable balance #{index}.')
 
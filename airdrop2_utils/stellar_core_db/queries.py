@@ -46,5 +46,5 @@ def get_trustline_for_liquidity_pools(pool_asset_list: Iterable[str]) -> Select:
     return select(TrustLine).where(TrustLine.asset.in_(pool_asset_list))
 
 
-def get_all_claimable_balances() -> Select:
-    return select(ClaimableBalance)
+def get_all_claimable_balance_entries() -> Select:
+    return select(ClaimableBalance.ledgerentry)